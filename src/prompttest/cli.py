@@ -1,4 +1,5 @@
 import asyncio
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
@@ -14,6 +15,17 @@ app = typer.Typer(
 )
 
 
+@lru_cache(maxsize=None)
+def _load_template(path: str) -> str:
+    # Packaged templates never change at runtime, so repeat inits skip the read
+    return Path(path).read_text(encoding="utf-8")
+
+
+def clear_caches() -> None:
+    """Clear CLI-level caches for deterministic fresh reads."""
+    _load_template.cache_clear()
+
+
 def _execute_run(
     *,
     patterns: List[str] | None,
@@ -50,16 +62,14 @@ def init():
 
     try:
         templates_dir = Path(__file__).parent / "templates"
-        env_template = (templates_dir / "_env.txt").read_text(encoding="utf-8")
-        guide_template = (templates_dir / "_guide.md").read_text(encoding="utf-8")
-        prompt_template = (templates_dir / "_customer_service.txt").read_text(
-            encoding="utf-8"
-        )
-        global_config_template = (templates_dir / "_global_config.yml").read_text(
-            encoding="utf-8"
+        env_template = _load_template(str(templates_dir / "_env.txt"))
+        guide_template = _load_template(str(templates_dir / "_guide.md"))
+        prompt_template = _load_template(str(templates_dir / "_customer_service.txt"))
+        global_config_template = _load_template(
+            str(templates_dir / "_global_config.yml")
         )
-        example_suite_template = (templates_dir / "_test_customers.yml").read_text(
-            encoding="utf-8"
+        example_suite_template = _load_template(
+            str(templates_dir / "_test_customers.yml")
         )
     except FileNotFoundError as e:
         ui.render_template_error(e)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 import re
+import warnings
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import yaml
 
@@ -12,6 +14,17 @@ from .models import Config, TestCase, TestSuite
 PROMPTTESTS_DIR = Path("prompttests")
 PROMPTS_DIR = Path("prompts")
 
+# Prefer the LibYAML-backed loader; PyYAML builds without libyaml lack it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if _SafeLoader is yaml.SafeLoader:
+    # ImportWarning is hidden by default but shows up under pytest and -W
+    warnings.warn(
+        "PyYAML was built without libyaml; falling back to the much slower "
+        "pure-Python SafeLoader.",
+        ImportWarning,
+        stacklevel=1,
+    )
+
 
 def _deep_merge(source: dict, destination: dict) -> dict:
     """Recursively merge dictionaries, with values from 'source' overwriting 'destination'."""
@@ -61,7 +74,7 @@ def _read_text_cached(p: Path) -> str:
 
 @lru_cache(maxsize=None)
 def _load_yaml_file(p: Path) -> Dict[str, Any]:
-    return yaml.safe_load(_read_text_cached(p)) or {}
+    return yaml.load(_read_text_cached(p), Loader=_SafeLoader) or {}
 
 
 def _find_anchors(yaml_text: str) -> set[str]:
@@ -88,16 +101,30 @@ def _find_anchor_dupes_in_text(yaml_text: str) -> list[str]:
     return list(dupes)
 
 
+def _iter_suite_files(root: str) -> Iterator[str]:
+    """Yield .yml/.yaml file paths under root in one scandir pass per directory."""
+    stack = [root]
+    while stack:
+        # Like rglob, skip directories that cannot be listed
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                # Extensions match case-insensitively, as in cli._classify_patterns
+                elif entry.name.lower().endswith((".yml", ".yaml")):
+                    yield entry.path
+
+
 def discover_and_prepare_suites() -> List[TestSuite]:
     if not PROMPTTESTS_DIR.is_dir():
         raise FileNotFoundError(f"Directory '{PROMPTTESTS_DIR}' not found.")
 
     suites = []
-    suite_files = list(PROMPTTESTS_DIR.rglob("*.yml")) + list(
-        PROMPTTESTS_DIR.rglob("*.yaml")
-    )
-
-    suite_files.sort()
+    suite_files = sorted(Path(p) for p in _iter_suite_files(str(PROMPTTESTS_DIR)))
 
     for suite_file in suite_files:
         if suite_file.name in ("prompttest.yml", "prompttest.yaml"):
@@ -145,7 +172,9 @@ def discover_and_prepare_suites() -> List[TestSuite]:
         single_doc_text = anchors_prelude + "\n" + _read_text_cached(suite_file)
 
         try:
-            parsed_single: Dict[str, Any] = yaml.safe_load(single_doc_text) or {}
+            parsed_single: Dict[str, Any] = (
+                yaml.load(single_doc_text, Loader=_SafeLoader) or {}
+            )
         except yaml.YAMLError as e:
             raise ValueError(
                 f"Error parsing YAML in {suite_file} or its configs: {e}"
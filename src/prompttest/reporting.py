@@ -5,6 +5,7 @@ import re
 import shutil
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 from rich.console import Console
 
@@ -45,10 +46,10 @@ def report_path_for(result: TestResult, run_dir: Path) -> Path:
     return run_dir / report_filename_for(result)
 
 
-def create_run_directory() -> Path:
+def create_run_directory(now_fn: Callable[[], datetime] = datetime.now) -> Path:
     """Creates the main reports directory and a timestamped subdirectory for the current run."""
     REPORTS_DIR.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+    timestamp = now_fn().strftime("%Y-%m-%d_%H-%M-%S-%f")
     run_dir = REPORTS_DIR / timestamp
     if run_dir.exists():
         i = 1
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import re
+
+
+def assert_all_in(out: str, *markers: str) -> None:
+    # Check every marker occurs in out with a single regex scan; markers hidden by
+    # an overlapping match fall back to a plain substring check
+    pattern = re.compile("|".join(re.escape(m) for m in markers))
+    found = set(pattern.findall(out))
+    missing = [m for m in markers if m not in found and m not in out]
+    assert not missing, f"Missing from output: {missing}"
+
+
+class Out:
+    # Captured CLI output split once, so line-exact markers are set lookups
+    def __init__(self, s: str) -> None:
+        self.s = s
+        self.lines = set(s.splitlines())
+
+    def has(self, marker: str) -> bool:
+        return marker in self.s
+
+    def has_line(self, line: str) -> bool:
+        return line in self.lines
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Tuple
+
+# Constant LLM fakes, created once at import so monkeypatch only rebinds them
+_OK: Tuple[str, bool] = ("resp", False)
+_EOK: Tuple[bool, str, bool] = (True, "ok", False)
+
+
+async def ok_gen(*args: Any, **kwargs: Any) -> Tuple[str, bool]:
+    return _OK
+
+
+async def ok_eval(*args: Any, **kwargs: Any) -> Tuple[bool, str, bool]:
+    return _EOK
+
+
+class EndpointNotFaked(BaseException):
+    # A BaseException, so llm's broad "except Exception" fallbacks cannot
+    # swallow a call the test never set up
+    pass
+
+
+def _not_faked(name: str) -> Callable[..., Awaitable[Any]]:
+    async def _fail(*args: Any, **kwargs: Any) -> Any:
+        raise EndpointNotFaked(f"chat.completions.{name} is not faked")
+
+    return _fail
+
+
+def make_fake_client(
+    *,
+    create: Callable[..., Awaitable[Any]] | None = None,
+    parse: Callable[..., Awaitable[Any]] | None = None,
+) -> SimpleNamespace:
+    # Minimal stand-in for openai.AsyncOpenAI: only chat.completions.create/parse
+    completions = SimpleNamespace(
+        create=create or _not_faked("create"), parse=parse or _not_faked("parse")
+    )
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def fake_resp(content: Any = None, **message: Any) -> SimpleNamespace:
+    # Chat completion shaped like openai's: resp.choices[0].message.content
+    msg = SimpleNamespace(content=content, **message)
+    return SimpleNamespace(choices=[SimpleNamespace(message=msg)])
+
+
+def raiser(exc_factory: Callable[[], BaseException]) -> Callable[..., Awaitable[Any]]:
+    # Async endpoint that raises a fresh exception on every call
+    async def _raise(*args: Any, **kwargs: Any) -> Any:
+        raise exc_factory()
+
+    return _raise
+
+
+def returning(value: Any) -> Callable[..., Awaitable[Any]]:
+    # Async endpoint that always returns the same value
+    async def _return(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _return
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Mapping
+
+
+def make_tree(root: Path, files: Mapping[str, str | bytes]) -> None:
+    # Lay out files under root: one mkdir per unique parent, one write per file
+    for parent in sorted({(root / rel).parent for rel in files}):
+        parent.mkdir(parents=True, exist_ok=True)
+    for rel, content in files.items():
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        (root / rel).write_bytes(data)
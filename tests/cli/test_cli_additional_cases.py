@@ -6,7 +6,6 @@ from typing import List
 from typer.testing import CliRunner
 
 import prompttest.cli as cli_mod
-from prompttest import discovery
 from prompttest.cli import app
 
 
@@ -25,12 +24,7 @@ def test_default_callback_nonzero_exit_propagates(
     assert called == [1]
 
 
-def test_classify_patterns_subpath_without_extension(monkeypatch, in_tmp_project: Path):
-    pt = in_tmp_project / "prompttests"
-    (pt / "gamma").mkdir(parents=True)
-    (pt / "gamma" / "sample.yml").write_text("config:\n  prompt: x\n", encoding="utf-8")
-    monkeypatch.setattr(discovery, "PROMPTTESTS_DIR", pt)
-
+def test_classify_patterns_subpath_without_extension():
     files, ids = cli_mod._classify_patterns(["gamma/sample"])
     assert sorted(files) == [
         "gamma/sample/**/*.yaml",
@@ -41,10 +35,7 @@ def test_classify_patterns_subpath_without_extension(monkeypatch, in_tmp_project
     assert ids == []
 
 
-def test_classify_patterns_none_is_treated_as_empty(monkeypatch, in_tmp_project: Path):
-    pt = in_tmp_project / "prompttests"
-    pt.mkdir()
-    monkeypatch.setattr(discovery, "PROMPTTESTS_DIR", pt)
+def test_classify_patterns_none_is_treated_as_empty():
     files, ids = cli_mod._classify_patterns(None or [])
     assert files == []
     assert ids == []
@@ -1,134 +1,118 @@
 from __future__ import annotations
 
+import hashlib
+import re
 from pathlib import Path
 
 import click
 import pytest
+from _asserts import Out, assert_all_in
 
 import prompttest.cli as cli_mod
 from prompttest.cli import app
 
+# Blocks init appends to .gitignore, with and without the .env entry
+_GI_TAIL_NO_ENV = (
+    "# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n"
+)
+_GI_TAIL_FULL = f"{_GI_TAIL_NO_ENV}\n# Environment variables\n.env\n"
+
+pytestmark = pytest.mark.usefixtures("_warmup_cli")
+
 
 def test_init_creates_files_with_exact_contents_and_summary(
-    runner, in_tmp_project: Path, template_texts
+    runner, in_tmp_project: Path, template_bytes, scaffold_gitignore
 ):
     res = runner.invoke(app, ["init"])
     assert res.exit_code == 0, res.stdout
 
-    for rel_path, expected in template_texts.items():
+    for rel_path, expected in template_bytes.items():
         p = in_tmp_project / rel_path
         assert p.exists()
-        assert p.read_text(encoding="utf-8") == expected
+        assert p.read_bytes() == expected
 
     gi = in_tmp_project / ".gitignore"
     assert gi.exists()
-    assert gi.read_text(encoding="utf-8") == (
-        "# prompttest cache\n"
-        ".prompttest_cache/\n\n"
-        "# Test reports\n"
-        ".prompttest_reports/\n\n"
-        "# Environment variables\n"
-        ".env\n"
+    # Also pins the .gitignore that initialized_project writes without running init
+    assert gi.read_bytes() == scaffold_gitignore
+
+    out = Out(res.stdout)
+    assert out.has_line("Initializing prompttest...")
+    assert out.has_line("Successfully initialized prompttest!")
+    assert out.has_line("Project structure:")
+    assert out.has_line("Next steps:")
+    assert_all_in(
+        out.s,
+        "prompts/customer_service.txt",
+        ".env",
+        "DO NOT COMMIT",
+        ".gitignore",
+        "(created)",
+        "Run prompttest to see your example tests run!",
     )
 
-    out = res.stdout
-    assert "Initializing prompttest" in out
-    assert "Successfully initialized prompttest!" in out
-    assert "Project structure:" in out
-    assert "prompts/customer_service.txt" in out
-    assert ".env" in out and "DO NOT COMMIT" in out
-    assert ".gitignore" in out and "(created)" in out
-    assert "Next steps:" in out
-    assert "Run prompttest to see your example tests run!" in out
+
+def _digest(p: Path) -> bytes:
+    return hashlib.blake2b(p.read_bytes(), digest_size=16).digest()
 
 
 def test_init_is_idempotent_and_skips_existing_files(
-    runner, in_tmp_project: Path, template_texts
+    runner, initialized_project: Path, template_bytes
 ):
-    first = runner.invoke(app, ["init"])
-    assert first.exit_code == 0
-
-    snapshot = {
-        rel: (in_tmp_project / rel).read_text(encoding="utf-8")
-        for rel in template_texts
-    }
+    # The scaffold already matches a first init (pinned above), so only the
+    # re-run is invoked
+    paths = [initialized_project / rel for rel in (*template_bytes, ".gitignore")]
+    before = [_digest(p) for p in paths]
 
-    second = runner.invoke(app, ["init"])
-    assert second.exit_code == 0
+    res = runner.invoke(app, ["init"])
+    assert res.exit_code == 0
 
-    for rel_path, before in snapshot.items():
-        after = (in_tmp_project / rel_path).read_text(encoding="utf-8")
-        assert after == before
+    assert [_digest(p) for p in paths] == before
 
-    out = second.stdout
+    out = res.stdout
     assert out.count("(exists, skipped)") >= 6
-    assert ".gitignore" in out and "(exists, skipped)" in out
+    assert_all_in(out, ".gitignore", "(exists, skipped)")
+
+
+_GITIGNORE_CASES = [
+    (None, _GI_TAIL_FULL, "(created)"),
+    ("foo", f"foo\n\n{_GI_TAIL_FULL}", "(updated)"),
+    ("foo\n", f"foo\n\n{_GI_TAIL_FULL}", "(updated)"),
+    ("foo\n\n", f"foo\n\n{_GI_TAIL_FULL}", "(updated)"),
+    (_GI_TAIL_FULL, _GI_TAIL_FULL, "(exists, skipped)"),
+    ("foo\n.env\n", f"foo\n.env\n\n{_GI_TAIL_NO_ENV}", "(updated)"),
+    ("\ufeff.env\n", f"\ufeff.env\n\n{_GI_TAIL_NO_ENV}", "(updated)"),
+    (".env \n", f".env \n\n{_GI_TAIL_FULL}", "(updated)"),
+    (
+        "config/.env.production\n",
+        f"config/.env.production\n\n{_GI_TAIL_FULL}",
+        "(updated)",
+    ),
+]
 
 
 @pytest.mark.parametrize(
-    "initial, expected, status_id",
+    "initial, expected, status_re",
     [
         (
-            None,
-            "# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "(created)",
-        ),
-        (
-            "foo",
-            "foo\n\n# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "(updated)",
-        ),
-        (
-            "foo\n",
-            "foo\n\n# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "(updated)",
-        ),
-        (
-            "foo\n\n",
-            "foo\n\n# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "(updated)",
-        ),
-        (
-            "# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "(exists, skipped)",
-        ),
-        (
-            "foo\n.env\n",
-            "foo\n.env\n\n# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n",
-            "(updated)",
-        ),
-        (
-            "\ufeff.env\n",
-            "\ufeff.env\n\n# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n",
-            "(updated)",
-        ),
-        (
-            ".env \n",
-            ".env \n\n# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "(updated)",
-        ),
-        (
-            "config/.env.production\n",
-            "config/.env.production\n\n# prompttest cache\n.prompttest_cache/\n\n# Test reports\n.prompttest_reports/\n\n# Environment variables\n.env\n",
-            "(updated)",
-        ),
+            None if initial is None else initial.encode(),
+            expected.encode(),
+            # Status is the first parenthesised token after the entry (may wrap)
+            re.compile(r"\.gitignore\s[^(]*" + re.escape(status)),
+        )
+        for initial, expected, status in _GITIGNORE_CASES
     ],
 )
 def test_gitignore_update_variants(
-    runner, in_tmp_project: Path, initial, expected, status_id
+    runner, in_tmp_project: Path, initial, expected, status_re
 ):
     gi = in_tmp_project / ".gitignore"
     if initial is not None:
-        gi.write_text(initial, encoding="utf-8")
+        gi.write_bytes(initial)
     res = runner.invoke(app, ["init"])
     assert res.exit_code == 0
-    assert gi.read_text(encoding="utf-8") == expected
-    assert ".gitignore" in res.stdout
-    assert any(
-        marker in res.stdout
-        for marker in ["(created)", "(updated)", "(exists, skipped)"]
-    )
+    assert gi.read_bytes() == expected
+    assert status_re.search(res.stdout)
 
 
 def test_init_exits_gracefully_if_gitignore_is_a_directory(
@@ -165,6 +149,19 @@ def test_init_template_missing_reports_filename(
     assert "_test_customers.yml" in captured.err
 
 
+def test_init_reads_each_template_once_per_process(runner, tmp_path: Path, monkeypatch):
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        monkeypatch.chdir(tmp_path / name)
+        assert runner.invoke(app, ["init"]).exit_code == 0
+
+    info = cli_mod._load_template.cache_info()
+    assert info.misses == 5
+    assert info.hits == 5
+    cli_mod.clear_caches()
+    assert cli_mod._load_template.cache_info().currsize == 0
+
+
 def test_init_bubbles_up_permission_error_on_file_write(
     monkeypatch, runner, in_tmp_project: Path
 ):
@@ -11,16 +11,8 @@ from prompttest import discovery, runner as runner_mod
 from prompttest.cli import app
 
 
-def test_classify_patterns_variants(monkeypatch, in_tmp_project: Path):
-    pt = in_tmp_project / "prompttests"
-    pt.mkdir()
-    (pt / "alpha").mkdir()
-    (pt / "beta").mkdir()
-    (pt / "alpha" / "test.yml").write_text("config:\n  prompt: x\n", encoding="utf-8")
-    (pt / "beta" / "sample.yaml").write_text("config:\n  prompt: y\n", encoding="utf-8")
-
-    monkeypatch.setattr(discovery, "PROMPTTESTS_DIR", pt)
-
+def test_classify_patterns_variants():
+    # Classification is purely lexical, so no files need to exist on disk
     file_globs, id_globs = cli_mod._classify_patterns(
         ["test", "alpha/test.yml", "zzz", "beta/sample.yaml", "custom.yaml", "alpha/"]
     )
@@ -32,12 +24,7 @@ def test_classify_patterns_variants(monkeypatch, in_tmp_project: Path):
     assert "zzz" in id_globs and "test" in id_globs
 
 
-def test_classify_patterns_when_prompttests_missing(monkeypatch, in_tmp_project: Path):
-    pt = in_tmp_project / "prompttests"
-    if pt.exists():
-        pt.rmdir()
-    monkeypatch.setattr(discovery, "PROMPTTESTS_DIR", pt)
-
+def test_classify_patterns_splits_yaml_names_from_id_globs():
     files, ids = cli_mod._classify_patterns(["abc", "suite.yml"])
     assert files == ["**/suite.yml", "suite.yml"]
     assert ids == ["abc"]
@@ -104,9 +91,7 @@ def test_positional_dir_includes_direct_and_recursive_globs(
     suite_dir = f"suite_{uuid.uuid4().hex[:8]}"
     pt = in_tmp_project / "prompttests"
     (pt / suite_dir).mkdir(parents=True, exist_ok=True)
-    (pt / suite_dir / "magic.yml").write_text(
-        "config:\n  prompt: x\n", encoding="utf-8"
-    )
+    (pt / suite_dir / "magic.yml").write_bytes(b"config:\n  prompt: x\n")
     monkeypatch.setattr(discovery, "PROMPTTESTS_DIR", pt)
 
     captured: Dict[str, Any] = {}
@@ -136,9 +121,7 @@ def test_dir_option_includes_direct_and_recursive_globs(
     suite_dir = f"suite_{uuid.uuid4().hex[:8]}"
     pt = in_tmp_project / "prompttests"
     (pt / suite_dir).mkdir(parents=True, exist_ok=True)
-    (pt / suite_dir / "magic.yml").write_text(
-        "config:\n  prompt: y\n", encoding="utf-8"
-    )
+    (pt / suite_dir / "magic.yml").write_bytes(b"config:\n  prompt: y\n")
     monkeypatch.setattr(discovery, "PROMPTTESTS_DIR", pt)
 
     captured: Dict[str, Any] = {}
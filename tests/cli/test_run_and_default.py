@@ -1,42 +1,40 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List
 
+import pytest
+
 from prompttest import runner as runner_mod
 from prompttest.cli import app
 
 
-def test_prompttest_without_args_invokes_run_command(
-    monkeypatch, runner, in_tmp_project: Path
-):
-    called: List[int] = []
-
-    async def fake_run_all_tests() -> int:
-        called.append(1)
-        return 0
-
-    monkeypatch.setattr(runner_mod, "run_all_tests", fake_run_all_tests)
-    res = runner.invoke(app, [])
-    assert res.exit_code == 0
-    assert called == [1]
-
+@pytest.fixture()
+def fake_run_all_tests(monkeypatch) -> SimpleNamespace:
+    # Stand-in for runner.run_all_tests; tests set .rc and inspect .calls
+    state = SimpleNamespace(rc=0, calls=[])
 
-def test_prompttest_run_command_explicit(monkeypatch, runner, in_tmp_project: Path):
-    async def fake_run_all_tests() -> int:
-        return 0
+    async def _fake(**kwargs) -> int:
+        state.calls.append(kwargs)
+        return state.rc
 
-    monkeypatch.setattr(runner_mod, "run_all_tests", fake_run_all_tests)
-    res = runner.invoke(app, ["run"])
-    assert res.exit_code == 0
+    monkeypatch.setattr(runner_mod, "run_all_tests", _fake)
+    return state
 
 
-def test_prompttest_run_nonzero_exit_propagates(
-    monkeypatch, runner, in_tmp_project: Path
+@pytest.mark.parametrize(
+    "argv, rc",
+    [
+        pytest.param([], 0, id="no-args-invokes-run"),
+        pytest.param(["run"], 0, id="run-explicit"),
+        pytest.param(["run"], 3, id="run-nonzero-exit-propagates"),
+    ],
+)
+def test_prompttest_run_and_default(
+    runner, in_tmp_project: Path, fake_run_all_tests, argv: List[str], rc: int
 ):
-    async def fake_run_all_tests() -> int:
-        return 3
-
-    monkeypatch.setattr(runner_mod, "run_all_tests", fake_run_all_tests)
-    res = runner.invoke(app, ["run"])
-    assert res.exit_code == 3
+    fake_run_all_tests.rc = rc
+    res = runner.invoke(app, argv)
+    assert res.exit_code == rc
+    assert fake_run_all_tests.calls == [{}]
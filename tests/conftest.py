@@ -1,16 +1,63 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import shutil
+import sys
+from importlib import resources
 from pathlib import Path
-from typing import Callable, Dict, Iterator, Tuple
+from types import MappingProxyType, SimpleNamespace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Tuple,
+)
 
 import pytest
+from _stubs import ok_eval, ok_gen
+from _treebuild import make_tree
 from typer.testing import CliRunner
 
-import prompttest.cli as cli
-from prompttest import llm
-from prompttest.llm import _get_cache_key, _write_cache
+
+@pytest.fixture(scope="module")
+async def _no_leaked_tasks() -> Any:
+    # Async modules opt in via pytestmark; their tests share one loop and
+    # nothing may outlive its test
+    yield
+    current = asyncio.current_task()
+    leaked = [t for t in asyncio.all_tasks() if t is not current]
+    assert not leaked, f"Tasks leaked into the module event loop: {leaked}"
+
+
+# Modules exposing clear_caches(); only those a test has already imported are
+# cleared, so the fixture never imports anything itself
+_CACHED_MODULES = ("prompttest.discovery", "prompttest.cli")
+
+
+def _clear_module_caches() -> None:
+    for name in _CACHED_MODULES:
+        mod = sys.modules.get(name)
+        if mod is not None:
+            mod.clear_caches()
+
+
+@pytest.fixture(autouse=True)
+def _bust_caches() -> Iterator[None]:
+    # Isolate tests from the discovery and CLI read caches
+    _clear_module_caches()
+    yield
+    _clear_module_caches()
+
+
+@pytest.fixture(autouse=True)
+def _plain_rich_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Consoles created during a test skip colour and terminal styling
+    monkeypatch.setenv("NO_COLOR", "1")
+    monkeypatch.setenv("TERM", "dumb")
 
 
 @pytest.fixture(scope="session")
@@ -19,122 +66,188 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def _warmup_cli(runner: CliRunner) -> None:
+    # Pay Typer/click start-up once, before the first real CLI invocation
+    from prompttest.cli import app
+
+    runner.invoke(app, ["--help"])
+
+
 @pytest.fixture()
 def in_tmp_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    # Start all tests in a fresh tmp directory as CWD
+    # Start all tests in a fresh, empty tmp directory as CWD; nothing is
+    # scaffolded, so error-path tests get a bare project (see initialized_project)
     monkeypatch.chdir(tmp_path)
     return tmp_path
 
 
+@pytest.fixture()
+def project_dirs(in_tmp_project: Path) -> Path:
+    # in_tmp_project plus empty prompts/ and prompttests/, made up front so the
+    # write helpers never mkdir; in_tmp_project itself stays bare
+    os.makedirs(in_tmp_project / "prompts", exist_ok=True)
+    os.makedirs(in_tmp_project / "prompttests", exist_ok=True)
+    return in_tmp_project
+
+
+@pytest.fixture()
+def fresh_run_dir(in_tmp_project: Path) -> Path:
+    # A plain reports run directory; only create_run_directory's own tests call it
+    run_dir = in_tmp_project / ".prompttest_reports" / "2025-01-01_00-00-00-000000"
+    run_dir.mkdir(parents=True)
+    return run_dir
+
+
 @pytest.fixture()
 def ensure_clean_cache_and_reports(in_tmp_project: Path) -> Iterator[None]:
     # Ensure no leftovers from prior runs
     cache_dir = in_tmp_project / ".prompttest_cache"
     reports_dir = in_tmp_project / ".prompttest_reports"
-    if cache_dir.exists():
-        shutil.rmtree(cache_dir)
-    if reports_dir.exists():
-        shutil.rmtree(reports_dir)
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    shutil.rmtree(reports_dir, ignore_errors=True)
     yield
-    if cache_dir.exists():
-        shutil.rmtree(cache_dir)
-    if reports_dir.exists():
-        shutil.rmtree(reports_dir)
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    shutil.rmtree(reports_dir, ignore_errors=True)
+
+
+# Resolved without importing prompttest.cli so collection stays cheap
+_TEMPLATES_DIR = Path(str(resources.files("prompttest"))) / "templates"
+
+# Scaffolded file -> template it is copied from
+_SCAFFOLD_TEMPLATES: Dict[str, str] = {
+    "prompts/customer_service.txt": "_customer_service.txt",
+    "prompttests/prompttest.yml": "_global_config.yml",
+    "prompttests/test_customers.yml": "_test_customers.yml",
+    "prompttests/GUIDE.md": "_guide.md",
+    ".env": "_env.txt",
+    ".env.example": "_env.txt",
+}
+
+_TEMPLATE_BYTES: Dict[str, bytes] = {
+    rel: (_TEMPLATES_DIR / name).read_bytes()
+    for rel, name in _SCAFFOLD_TEMPLATES.items()
+}
+
+
+# .gitignore as written by 'prompttest init' into an empty project
+_SCAFFOLD_GITIGNORE = (
+    b"# prompttest cache\n"
+    b".prompttest_cache/\n\n"
+    b"# Test reports\n"
+    b".prompttest_reports/\n\n"
+    b"# Environment variables\n"
+    b".env\n"
+)
 
 
 @pytest.fixture(scope="session")
-def templates_dir() -> Path:
-    # The CLI reads templates from package
-    return Path(cli.__file__).parent / "templates"
+def template_bytes() -> Mapping[str, bytes]:
+    # Map expected scaffolded files -> template bytes (read-only, shared)
+    return MappingProxyType(_TEMPLATE_BYTES)
 
 
 @pytest.fixture(scope="session")
-def template_texts(templates_dir: Path) -> Dict[str, str]:
-    # Map expected scaffolded files -> template contents
-    return {
-        "prompts/customer_service.txt": (
-            templates_dir / "_customer_service.txt"
-        ).read_text(encoding="utf-8"),
-        "prompttests/prompttest.yml": (templates_dir / "_global_config.yml").read_text(
-            encoding="utf-8"
-        ),
-        "prompttests/test_customers.yml": (
-            templates_dir / "_test_customers.yml"
-        ).read_text(encoding="utf-8"),
-        "prompttests/GUIDE.md": (templates_dir / "_guide.md").read_text(
-            encoding="utf-8"
-        ),
-        ".env": (templates_dir / "_env.txt").read_text(encoding="utf-8"),
-        ".env.example": (templates_dir / "_env.txt").read_text(encoding="utf-8"),
-    }
+def scaffold_gitignore() -> bytes:
+    # The .gitignore init writes into an empty project, shared with _scaffold
+    return _SCAFFOLD_GITIGNORE
 
 
-@pytest.fixture()
-def initialized_project(
-    in_tmp_project: Path, runner: CliRunner, template_texts: Dict[str, str]
+@pytest.fixture(scope="session")
+def _scaffold(
+    tmp_path_factory: pytest.TempPathFactory,
+    template_bytes: Mapping[str, bytes],
+    scaffold_gitignore: bytes,
 ) -> Path:
-    # Run 'prompttest init' to scaffold
-    result = runner.invoke(cli.app, ["init"])
-    assert result.exit_code == 0, f"Init failed: {result.stdout}"
-    # Verify expected files exist
-    for rel_path, expected in template_texts.items():
-        p = in_tmp_project / rel_path
-        assert p.exists(), f"Missing {rel_path}"
-        assert p.read_text(encoding="utf-8") == expected
+    # Materialize what 'prompttest init' scaffolds, once per session; init itself
+    # is covered by the CLI tests, so there is no need to dispatch it here
+    root = tmp_path_factory.mktemp("scaffold")
+    make_tree(root, {**template_bytes, ".gitignore": scaffold_gitignore})
+    return root
+
+
+@pytest.fixture()
+def initialized_project(in_tmp_project: Path, _scaffold: Path) -> Path:
+    # Per-test copy of the session scaffold
+    shutil.copytree(_scaffold, in_tmp_project, dirs_exist_ok=True)
+    return in_tmp_project
+
+
+@pytest.fixture()
+def pre_initialized_project(in_tmp_project: Path, _scaffold: Path) -> Path:
+    # Hardlinked scaffold minus .gitignore: init skips existing files, so the
+    # shared inodes are never written; tests supply their own .gitignore
+    shutil.copytree(
+        _scaffold,
+        in_tmp_project,
+        dirs_exist_ok=True,
+        copy_function=os.link,
+        ignore=shutil.ignore_patterns(".gitignore"),
+    )
     return in_tmp_project
 
 
 @pytest.fixture()
-def mock_llm_pass(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Mock llm.generate / llm.evaluate to always pass
-    async def fake_generate(
-        prompt: str, model: str, temperature: float
-    ) -> Tuple[str, bool]:
-        return f"[GEN:{model}|{temperature}] {prompt[:40]}", False
+def stub_llm(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    from prompttest import llm
+
+    # Constant generate/evaluate fakes; tests override one side when needed and
+    # get handles to whatever is installed
+    monkeypatch.setattr(llm, "generate", ok_gen)
+    monkeypatch.setattr(llm, "evaluate", ok_eval)
+    return SimpleNamespace(gen=ok_gen, eval=ok_eval)
 
-    async def fake_evaluate(
-        response: str, criteria: str, model: str, temperature: float
-    ) -> Tuple[bool, str, bool]:
-        return True, "Meets criteria", False
 
-    monkeypatch.setattr(llm, "generate", fake_generate)
-    monkeypatch.setattr(llm, "evaluate", fake_evaluate)
+# Shared results handed back by the selective evaluate fake
+_SELECTIVE_PASS: Tuple[bool, str, bool] = (True, "PASS as requested", False)
+_SELECTIVE_FAIL: Tuple[bool, str, bool] = (False, "FAIL as requested", False)
+
+
+async def _selective_eval(
+    response: str, criteria: str, model: str, temperature: float
+) -> Tuple[bool, str, bool]:
+    return _SELECTIVE_PASS if "expect-pass" in criteria else _SELECTIVE_FAIL
 
 
 @pytest.fixture()
-def mock_llm_selective(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Mock llm.evaluate to pass/fail based on criteria content; generate returns minimal
-    async def fake_generate(
-        prompt: str, model: str, temperature: float
-    ) -> Tuple[str, bool]:
-        return f"response for model={model} temp={temperature}", False
+def mock_llm_selective(
+    stub_llm: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> SimpleNamespace:
+    from prompttest import llm
 
-    async def fake_evaluate(
-        response: str, criteria: str, model: str, temperature: float
-    ) -> Tuple[bool, str, bool]:
-        if "expect-pass" in criteria:
-            return True, "PASS as requested", False
-        return False, "FAIL as requested", False
+    # stub_llm, but evaluate passes exactly the tests whose criteria mention
+    # "expect-pass"
+    monkeypatch.setattr(llm, "evaluate", _selective_eval)
+    stub_llm.eval = _selective_eval
+    return stub_llm
 
-    monkeypatch.setattr(llm, "generate", fake_generate)
-    monkeypatch.setattr(llm, "evaluate", fake_evaluate)
+
+@pytest.fixture()
+def mem_llm_cache(monkeypatch: pytest.MonkeyPatch) -> Dict[str, str]:
+    # Back the llm response cache with a per-test dict instead of .prompttest_cache/
+    from prompttest import llm
+
+    store: Dict[str, str] = {}
+    monkeypatch.setattr(llm, "_read_cache", store.get)
+    monkeypatch.setattr(llm, "_write_cache", store.__setitem__)
+    return store
 
 
 @pytest.fixture()
 def cache_primed() -> Iterator[None]:
     CACHE_DIR = Path(".prompttest_cache")
-    if CACHE_DIR.exists():
-        shutil.rmtree(CACHE_DIR)
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
     CACHE_DIR.mkdir(exist_ok=True)
     yield
-    if CACHE_DIR.exists():
-        shutil.rmtree(CACHE_DIR)
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
 
 
 @pytest.fixture()
 def prime_generate_cache(
     cache_primed: None,
 ) -> Callable[[str, str, float, str], None]:
+    from prompttest.llm import _get_cache_key, _write_cache
+
     # Helper to put an entry into the generate() cache
     def _prime(prompt: str, model: str, temperature: float, content: str) -> None:
         key = _get_cache_key(
@@ -149,6 +262,8 @@ def prime_generate_cache(
 def prime_evaluate_cache(
     cache_primed: None,
 ) -> Callable[[str, str, float, str, Dict[str, object]], None]:
+    from prompttest.llm import _get_cache_key, _write_cache
+
     # Helper to put an entry into the structured evaluate() cache
     def _prime(
         criteria: str,
@@ -179,24 +294,68 @@ def prime_evaluate_cache(
 
 
 @pytest.fixture()
-def write_suite_file(in_tmp_project: Path) -> Callable[[str, str], Path]:
-    # Utility to write a test suite file into prompttests/
-    def _write(rel_path: str, content: str) -> Path:
-        dst = in_tmp_project / "prompttests" / rel_path
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_text(content, encoding="utf-8")
-        return dst
+def write_suite_file(project_dirs: Path) -> Callable[[str, str | bytes], Path]:
+    # Utility to write a test suite file into prompttests/, subdirectories included
+    def _write(rel_path: str, content: str | bytes) -> Path:
+        make_tree(project_dirs / "prompttests", {rel_path: content})
+        return project_dirs / "prompttests" / rel_path
+
+    return _write
+
+
+_SCENARIO_SUITE = """\
+config:
+  prompt: {prompt}
+  generation_model: "test/gen"
+  evaluation_model: "test/eval"
+tests:
+  - id: {test_id}
+    inputs:
+{inputs}
+    criteria: "{criteria}"
+"""
+
+
+def _render_inputs(inputs: Mapping[str, str]) -> str:
+    # Double-quoted YAML scalars (JSON strings) so free-form text survives as-is
+    return "\n".join(
+        f"      {k}: {json.dumps(v, ensure_ascii=False)}" for k, v in inputs.items()
+    )
+
+
+@pytest.fixture()
+def write_scenario_suite(
+    write_suite_file: Callable[[str, str | bytes], Path],
+) -> Callable[..., Path]:
+    # One-test suite rendered from the module-level template, written through
+    # write_suite_file
+    def _write(
+        name: str,
+        test_id: str,
+        inputs: Mapping[str, str],
+        criteria: str,
+        *,
+        prompt: str = "cs",
+    ) -> Path:
+        text = _SCENARIO_SUITE.format_map(
+            {
+                "prompt": prompt,
+                "test_id": test_id,
+                "inputs": _render_inputs(inputs),
+                "criteria": criteria,
+            }
+        )
+        return write_suite_file(name, text)
 
     return _write
 
 
 @pytest.fixture()
-def write_prompt_file(in_tmp_project: Path) -> Callable[[str, str], Path]:
+def write_prompt_file(project_dirs: Path) -> Callable[[str, str], Path]:
     # Utility to write a prompt template into prompts/
     def _write(name_without_ext: str, content: str) -> Path:
-        dst = in_tmp_project / "prompts" / f"{name_without_ext}.txt"
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_text(content, encoding="utf-8")
+        dst = project_dirs / "prompts" / f"{name_without_ext}.txt"
+        dst.write_bytes(content.encode("utf-8"))
         return dst
 
     return _write
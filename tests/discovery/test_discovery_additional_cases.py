@@ -1,64 +1,124 @@
 from __future__ import annotations
 
+import importlib
+import os
+import re
 from pathlib import Path
 
 import pytest
+import yaml
+from _treebuild import make_tree
 
-import prompttest.discovery as discovery
 from prompttest.discovery import discover_and_prepare_suites
 
+_ANCHOR_DUPE_RE = re.compile(
+    r"Duplicate YAML anchor names found within .*prompttest\.yml: dupe\."
+)
+_SUITE_PARSE_ERROR_RE = re.compile(
+    r"Error parsing YAML in prompttests/suite\.yml or its configs:"
+)
 
-def test_duplicate_yaml_anchors_within_single_config_doc_raises(
-    in_tmp_project: Path, write_prompt_file
-):
-    discovery.clear_caches()
-    write_prompt_file("cs", "Body")
 
-    pt = in_tmp_project / "prompttests"
-    pt.mkdir()
-    (pt / "prompttest.yml").write_text(
-        "reusable:\n  inputs:\n    a: &dupe 1\n    b: &dupe 2\n",
-        encoding="utf-8",
+def test_duplicate_yaml_anchors_within_single_config_doc_raises(in_tmp_project: Path):
+    make_tree(
+        in_tmp_project,
+        {
+            "prompts/cs.txt": "Body",
+            "prompttests/prompttest.yml": (
+                "reusable:\n  inputs:\n    a: &dupe 1\n    b: &dupe 2\n"
+            ),
+            "prompttests/suite.yml": (
+                "config:\n  prompt: cs\ntests:\n"
+                "  - id: t\n    inputs: {}\n    criteria: 'x'\n"
+            ),
+        },
     )
-    (pt / "suite.yml").write_text(
-        "config:\n  prompt: cs\ntests:\n  - id: t\n    inputs: {}\n    criteria: 'x'\n",
-        encoding="utf-8",
+
+    with pytest.raises(ValueError) as ei:
+        discover_and_prepare_suites()
+    assert _ANCHOR_DUPE_RE.search(str(ei.value))
+
+
+def test_multi_document_config_is_not_supported_parsing_error(in_tmp_project: Path):
+    make_tree(
+        in_tmp_project,
+        {
+            "prompts/cs.txt": "Body",
+            "prompttests/prompttest.yml": (
+                "reusable:\n"
+                "  inputs:\n"
+                "    a: &x 1\n"
+                "---\n"
+                "reusable:\n"
+                "  criteria:\n"
+                "    b: &x 2\n"
+            ),
+            "prompttests/suite.yml": (
+                "config:\n  prompt: cs\ntests:\n"
+                "  - id: t\n    inputs: {}\n    criteria: 'y'\n"
+            ),
+        },
     )
 
-    with pytest.raises(
-        ValueError,
-        match=r"Duplicate YAML anchor names found within .*prompttest\.yml: dupe\.",
-    ):
+    with pytest.raises(ValueError) as ei:
         discover_and_prepare_suites()
+    assert _SUITE_PARSE_ERROR_RE.search(str(ei.value))
 
 
-def test_multi_document_config_is_not_supported_parsing_error(
-    in_tmp_project: Path, write_prompt_file
-):
-    discovery.clear_caches()
-    write_prompt_file("cs", "Body")
-
-    pt = in_tmp_project / "prompttests"
-    pt.mkdir()
-    (pt / "prompttest.yml").write_text(
-        (
-            "reusable:\n"
-            "  inputs:\n"
-            "    a: &x 1\n"
-            "---\n"
-            "reusable:\n"
-            "  criteria:\n"
-            "    b: &x 2\n"
-        ),
-        encoding="utf-8",
+def test_unreadable_suite_directory_is_skipped(monkeypatch, in_tmp_project: Path):
+    from prompttest import discovery
+
+    make_tree(
+        in_tmp_project,
+        {
+            "prompts/cs.txt": "Body",
+            "prompttests/ok.yml": (
+                "config:\n  prompt: cs\ntests:\n"
+                "  - id: t\n    inputs: {}\n    criteria: 'x'\n"
+            ),
+            "prompttests/locked/hidden.yml": "not: reached\n",
+        },
     )
-    (pt / "suite.yml").write_text(
-        "config:\n  prompt: cs\ntests:\n  - id: t\n    inputs: {}\n    criteria: 'y'\n",
-        encoding="utf-8",
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(discovery.os, "scandir", scandir)
+
+    assert [s.file_path.name for s in discover_and_prepare_suites()] == ["ok.yml"]
+
+
+def test_upper_case_suite_extensions_are_discovered(in_tmp_project: Path):
+    suite = (
+        "config:\n  prompt: cs\ntests:\n  - id: t\n    inputs: {}\n    criteria: 'x'\n"
+    )
+    make_tree(
+        in_tmp_project,
+        {
+            "prompts/cs.txt": "Body",
+            "prompttests/a.YML": suite,
+            "prompttests/sub/b.Yaml": suite,
+            "prompttests/notes.txt": "ignored",
+        },
     )
 
-    with pytest.raises(
-        ValueError,
-        match=r"Error parsing YAML in prompttests/suite\.yml or its configs:",
-    ):
-        discover_and_prepare_suites()
+    names = [s.file_path.name for s in discover_and_prepare_suites()]
+    assert names == ["a.YML", "b.Yaml"]
+
+
+def test_missing_libyaml_warns_and_falls_back_to_safe_loader(monkeypatch):
+    from prompttest import discovery
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        with pytest.warns(ImportWarning, match="built without libyaml") as rec:
+            importlib.reload(discovery)
+        assert discovery._SafeLoader is yaml.SafeLoader
+        # stacklevel=1 attributes the warning to discovery, not importlib
+        assert rec[0].filename == discovery.__file__
+    finally:
+        monkeypatch.undo()
+        importlib.reload(discovery)
@@ -2,20 +2,23 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from prompttest.discovery import PROMPTS_DIR, discover_and_prepare_suites
+from _treebuild import make_tree
+
+from prompttest.discovery import discover_and_prepare_suites
 
 
 def test_discover_with_no_config_files_uses_empty_anchors_prelude(
     in_tmp_project: Path,
 ):
-    PROMPTS_DIR.mkdir(exist_ok=True)
-    (PROMPTS_DIR / "cs.txt").write_text("Body", encoding="utf-8")
-
-    pdir = in_tmp_project / "prompttests"
-    pdir.mkdir()
-    (pdir / "suite.yml").write_text(
-        "config:\n  prompt: cs\ntests:\n  - id: t\n    inputs: {}\n    criteria: 'ok'\n",
-        encoding="utf-8",
+    make_tree(
+        in_tmp_project,
+        {
+            "prompts/cs.txt": "Body",
+            "prompttests/suite.yml": (
+                "config:\n  prompt: cs\ntests:\n"
+                "  - id: t\n    inputs: {}\n    criteria: 'ok'\n"
+            ),
+        },
     )
 
     suites = discover_and_prepare_suites()
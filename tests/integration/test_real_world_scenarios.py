@@ -1,247 +1,116 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Awaitable, Callable, Dict, Tuple
 
 import pytest
 
 from prompttest import runner
 
+pytestmark = pytest.mark.usefixtures("_no_leaked_tasks")
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_scraped_from_wild_html_entities_and_unicode(
-    monkeypatch, in_tmp_project: Path, write_prompt_file
-):
-    write_prompt_file(
-        "cs",
-        """
+_PROMPT_BODY = """
 ---[SYSTEM]---
 You are an expert support agent.
 ---[USER]---
 Tier: {tier}
 Question: {q}
-""",
-    )
-    Path("prompttests").mkdir()
-    Path("prompttests/test1.yml").write_text(
-        """
-config:
-  prompt: cs
-  generation_model: "test/gen"
-  evaluation_model: "test/eval"
-tests:
-  - id: wild
-    inputs:
-      tier: "Standard"
-      q: "Price shows as &euro; 49.99 — why?"
-    criteria: "expect-pass"
-""",
-        encoding="utf-8",
-    )
+"""
 
-    from prompttest import llm as llm_mod
-
-    async def fake_gen(prompt: str, model: str, temperature: float):
-        return "The price is € 49.99, thanks for asking.", False
 
-    async def fake_eval(response: str, criteria: str, model: str, temperature: float):
-        ok = "€" in response
-        return ok, "Entity normalized", False
-
-    monkeypatch.setattr(llm_mod, "generate", fake_gen)
-    monkeypatch.setattr(llm_mod, "evaluate", fake_eval)
-
-    code = await runner.run_all_tests()
-    assert code == 0
+@pytest.fixture()
+def prompt_and_dir(in_tmp_project: Path, write_prompt_file) -> Path:
+    # The support prompt every scenario renders; write_prompt_file's
+    # project_dirs already provides an empty prompttests/
+    write_prompt_file("cs", _PROMPT_BODY)
+    return in_tmp_project
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_generated_by_tool_almost_correct(
-    monkeypatch, in_tmp_project: Path, write_prompt_file
-):
-    write_prompt_file(
-        "cs",
-        """
----[SYSTEM]---
-You are an expert support agent.
----[USER]---
-Tier: {tier}
-Question: {q}
-""",
-    )
-    Path("prompttests").mkdir()
-    Path("prompttests/test2.yml").write_text(
-        """
-config:
-  prompt: cs
-  generation_model: "test/gen"
-  evaluation_model: "test/eval"
-tests:
-  - id: tool
-    inputs:
-      tier: "Premium"
-      q: "My tracking number is ABC-123"
-    criteria: "expect-pass"
-""",
-        encoding="utf-8",
-    )
-
-    from prompttest import llm as llm_mod
-
+def _gen(text: str) -> Callable[..., Awaitable[Tuple[str, bool]]]:
     async def fake_gen(prompt: str, model: str, temperature: float):
-        return "Tracking ABC-123 is in transit.", False
-
-    async def fake_eval(response: str, criteria: str, model: str, temperature: float):
-        return (
-            ("ABC-123" in response and "in transit" in response),
-            "Recognized tracking",
-            False,
-        )
-
-    monkeypatch.setattr(llm_mod, "generate", fake_gen)
-    monkeypatch.setattr(llm_mod, "evaluate", fake_eval)
-
-    code = await runner.run_all_tests()
-    assert code == 0
-
+        return text, False
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_human_edited_broke_format(
-    monkeypatch, in_tmp_project: Path, write_prompt_file
-):
-    write_prompt_file(
-        "cs",
-        """
----[SYSTEM]---
-You are an expert support agent.
----[USER]---
-Tier: {tier}
-Question: {q}
-""",
-    )
-    Path("prompttests").mkdir()
-    Path("prompttests/test3.yml").write_text(
-        """
-config:
-  prompt: cs
-  generation_model: "test/gen"
-  evaluation_model: "test/eval"
-tests:
-  - id: human-edited
-    inputs:
-      tier: "Standard"
-      q: "I NEED HELP!!!"
-    criteria: "expect-fail"
-""",
-        encoding="utf-8",
-    )
+    return fake_gen
 
-    from prompttest import llm as llm_mod
-
-    async def fake_gen(prompt: str, model: str, temperature: float):
-        return "CALM DOWN. Read the manual.", False
-
-    async def fake_eval(response: str, criteria: str, model: str, temperature: float):
-        return ("CALM DOWN" not in response), "Tone too harsh", False
-
-    monkeypatch.setattr(llm_mod, "generate", fake_gen)
-    monkeypatch.setattr(llm_mod, "evaluate", fake_eval)
-
-    code = await runner.run_all_tests()
-    assert code == 1
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_legacy_system_old_format(
-    monkeypatch, in_tmp_project: Path, write_prompt_file
-):
-    write_prompt_file(
-        "cs",
-        """
----[SYSTEM]---
-You are an expert support agent.
----[USER]---
-Tier: {tier}
-Question: {q}
-""",
-    )
-    Path("prompttests").mkdir()
-    Path("prompttests/test4.yml").write_text(
-        """
-config:
-  prompt: cs
-  generation_model: "test/gen"
-  evaluation_model: "test/eval"
-tests:
-  - id: legacy
-    inputs:
-      tier: "Legacy-VIP"
-      q: "Return policy?"
-    criteria: "expect-pass"
-""",
-        encoding="utf-8",
-    )
-
-    from prompttest import llm as llm_mod
-
-    async def fake_gen(prompt: str, model: str, temperature: float):
-        return "As a VIP, you have 30 days to return items.", False
 
+def _eval(
+    check: Callable[[str], bool], reason: str
+) -> Callable[..., Awaitable[Tuple[bool, str, bool]]]:
     async def fake_eval(response: str, criteria: str, model: str, temperature: float):
-        return ("30 days" in response), "Policy correct", False
+        return check(response), reason, False
 
-    monkeypatch.setattr(llm_mod, "generate", fake_gen)
-    monkeypatch.setattr(llm_mod, "evaluate", fake_eval)
-
-    code = await runner.run_all_tests()
-    assert code == 0
+    return fake_eval
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_corrupted_in_transit_partial_data(
-    monkeypatch, in_tmp_project: Path, write_prompt_file
+@pytest.mark.parametrize(
+    "test_id, inputs, criteria, gen, eval_, expected",
+    [
+        pytest.param(
+            "wild",
+            {"tier": "Standard", "q": "Price shows as &euro; 49.99 — why?"},
+            "expect-pass",
+            _gen("The price is € 49.99, thanks for asking."),
+            _eval(lambda r: "€" in r, "Entity normalized"),
+            0,
+            id="html_entities",
+        ),
+        pytest.param(
+            "tool",
+            {"tier": "Premium", "q": "My tracking number is ABC-123"},
+            "expect-pass",
+            _gen("Tracking ABC-123 is in transit."),
+            _eval(
+                lambda r: "ABC-123" in r and "in transit" in r, "Recognized tracking"
+            ),
+            0,
+            id="almost_correct",
+        ),
+        pytest.param(
+            "human-edited",
+            {"tier": "Standard", "q": "I NEED HELP!!!"},
+            "expect-fail",
+            _gen("CALM DOWN. Read the manual."),
+            _eval(lambda r: "CALM DOWN" not in r, "Tone too harsh"),
+            1,
+            id="broken_format",
+        ),
+        pytest.param(
+            "legacy",
+            {"tier": "Legacy-VIP", "q": "Return policy?"},
+            "expect-pass",
+            _gen("As a VIP, you have 30 days to return items."),
+            _eval(lambda r: "30 days" in r, "Policy correct"),
+            0,
+            id="legacy",
+        ),
+        pytest.param(
+            "corrupt",
+            {"tier": "", "q": "My parcel ????"},
+            "expect-fail",
+            _gen(""),
+            _eval(lambda r: bool(r.strip()), "Empty response"),
+            1,
+            id="corrupted",
+        ),
+    ],
+)
+async def test_llm_scenario(
+    monkeypatch,
+    prompt_and_dir: Path,
+    write_scenario_suite,
+    test_id: str,
+    inputs: Dict[str, str],
+    criteria: str,
+    gen,
+    eval_,
+    expected: int,
 ):
-    write_prompt_file(
-        "cs",
-        """
----[SYSTEM]---
-You are an expert support agent.
----[USER]---
-Tier: {tier}
-Question: {q}
-""",
-    )
-    Path("prompttests").mkdir()
-    Path("prompttests/test5.yml").write_text(
-        """
-config:
-  prompt: cs
-  generation_model: "test/gen"
-  evaluation_model: "test/eval"
-tests:
-  - id: corrupt
-    inputs:
-      tier: ""
-      q: "My parcel ????"
-    criteria: "expect-fail"
-""",
-        encoding="utf-8",
-    )
-
     from prompttest import llm as llm_mod
 
-    async def fake_gen(prompt: str, model: str, temperature: float):
-        return "", False
-
-    async def fake_eval(response: str, criteria: str, model: str, temperature: float):
-        return (bool(response.strip())), "Empty response", False
-
-    monkeypatch.setattr(llm_mod, "generate", fake_gen)
-    monkeypatch.setattr(llm_mod, "evaluate", fake_eval)
+    write_scenario_suite("test.yml", test_id, inputs, criteria)
+    monkeypatch.setattr(llm_mod, "generate", gen)
+    monkeypatch.setattr(llm_mod, "evaluate", eval_)
 
     code = await runner.run_all_tests()
-    assert code == 1
+    assert code == expected
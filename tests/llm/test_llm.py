@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from _stubs import EndpointNotFaked, fake_resp, make_fake_client, raiser, returning
+
+from prompttest import llm
+
+pytestmark = pytest.mark.usefixtures("_no_leaked_tasks")
+
+
+def _lit(s: str) -> re.Pattern[str]:
+    return re.compile(re.escape(s))
+
+
+class _FakeAPIStatusError(Exception):
+    def __init__(self, status_code: int, body: Any):
+        self.status_code = status_code
+        self.body = body
+
+
+_API_STATUS_CASES = [
+    pytest.param(
+        partial(
+            _FakeAPIStatusError, 503, {"error": {"metadata": {"provider_name": "foo"}}}
+        ),
+        _lit("API returned a 503 status code from provider 'foo'"),
+        id="with-provider",
+    ),
+    pytest.param(
+        partial(
+            _FakeAPIStatusError, 429, {"error": {"metadata": {"provider_name": "bar"}}}
+        ),
+        _lit("API returned a 429 status code from provider 'bar'"),
+        id="rate-limited-with-provider",
+    ),
+    pytest.param(
+        partial(_FakeAPIStatusError, 500, "oops"),
+        _lit("API returned a non-200 status code: 500."),
+        id="without-dict-body",
+    ),
+]
+
+# Structured eval is unsupported, so evaluate() falls back to plain text mode
+_NO_STRUCTURED = raiser(lambda: RuntimeError("structured unsupported"))
+
+_RE_NO_KEY = _lit("OPENROUTER_API_KEY not found")
+_RE_CONNECTION = _lit(
+    "Could not connect to the API. Please check your network connection."
+)
+_RE_AUTH = _lit("Authentication failed. Please verify your OPENROUTER_API_KEY.")
+_RE_TIMEOUT = _lit("The request to the API timed out. Please try again.")
+_RE_UNEXPECTED = _lit("Unexpected error while calling the API: boom")
+
+# Keyed by the model name each concurrent call uses, so one fake client can
+# raise a different exception per call; factories receive the auth sentinel
+_ERROR_CASES = {
+    "authentication-error": (lambda auth: auth, _RE_AUTH),
+    "timeout-error": (lambda auth: TimeoutError, _RE_TIMEOUT),
+    "unexpected-error": (lambda auth: RuntimeError, _RE_UNEXPECTED),
+}
+
+
+@pytest.fixture()
+def _auth_sentinel(monkeypatch) -> type[Exception]:
+    cls = type("_Auth", (Exception,), {})
+    monkeypatch.setattr(llm.openai, "AuthenticationError", cls, raising=False)
+    return cls
+
+
+class TestGetClient:
+    @pytest.fixture(autouse=True)
+    def _fresh_client(self) -> Iterator[None]:
+        # get_client memoizes the first client it builds
+        llm.get_client.cache_clear()
+        yield
+        llm.get_client.cache_clear()
+
+    def test_raises_without_env(self, monkeypatch):
+        monkeypatch.setattr(llm, "load_dotenv", lambda: None)
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        with pytest.raises(EnvironmentError, match=_RE_NO_KEY):
+            llm.get_client()
+
+    def test_succeeds_with_env(self, monkeypatch):
+        class FakeOpenAI:
+            def __init__(self, base_url: str, api_key: str, **kwargs: Any):
+                assert api_key == "k"
+                self.chat = make_fake_client(create=returning(fake_resp("HELLO"))).chat
+
+        monkeypatch.setattr(llm, "load_dotenv", lambda: None)
+        monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+        monkeypatch.setattr(llm.openai, "AsyncOpenAI", FakeOpenAI)
+
+        c1 = llm.get_client()
+        assert hasattr(c1, "chat")
+        assert llm.get_client() is c1
+
+
+class TestParseEvaluation:
+    @pytest.mark.parametrize(
+        "text, expected_pass, expected_reason, exact",
+        [
+            pytest.param(
+                "EVALUATION: PASS - All good", True, "All good", True, id="pass-simple"
+            ),
+            pytest.param(
+                "foo\nbar\nEVALUATION: PASS - Yay",
+                True,
+                "Yay",
+                True,
+                id="pass-multiline",
+            ),
+            pytest.param(
+                "EVALUATION: FAIL - Not correct",
+                False,
+                "Not correct",
+                True,
+                id="fail-simple",
+            ),
+            pytest.param(
+                "foo\nEVALUATION: FAIL - Bad tone",
+                False,
+                "Bad tone",
+                True,
+                id="fail-multiline",
+            ),
+            pytest.param(
+                "",
+                False,
+                "Evaluation failed: LLM returned an empty response.",
+                True,
+                id="empty",
+            ),
+            pytest.param(
+                "No verdict line here",
+                False,
+                "Invalid evaluation format.",
+                False,
+                id="no-verdict",
+            ),
+        ],
+    )
+    def test_variants(
+        self, text: str, expected_pass: bool, expected_reason: str, exact: bool
+    ):
+        passed, reason = llm._parse_evaluation(text)
+        assert passed is expected_pass
+        if exact:
+            assert reason == expected_reason
+        else:
+            assert reason.startswith(expected_reason)
+
+    def test_ignores_code_fences_and_backticks(self):
+        text = """
+```json
+{"foo": "bar"}
+```
+`EVALUATION: FAIL - Reason in backticks`
+"""
+        passed, reason = llm._parse_evaluation(text)
+        assert passed is False
+        assert reason == "Reason in backticks"
+
+
+class TestDiskCache:
+    def test_write_and_read_roundtrip(self, in_tmp_project: Path):
+        key = llm._get_cache_key({"k": "v"})
+        value = "cached-value"
+        assert llm._read_cache(key) is None
+        llm._write_cache(key, value)
+        assert llm._read_cache(key) == value
+
+    async def test_generate_uses_cache_and_sets_is_cached(
+        self, in_tmp_project: Path, prime_generate_cache
+    ):
+        prompt = "Hello"
+        model = "test-model"
+        temp = 0.0
+        prime_generate_cache(prompt, model, temp, "CACHED")
+
+        content, is_cached = await llm.generate(prompt, model, temp)
+        assert content == "CACHED"
+        assert is_cached is True
+
+    async def test_evaluate_uses_cache_and_parses(
+        self, in_tmp_project: Path, prime_evaluate_cache
+    ):
+        criteria = "X"
+        model = "judge-model"
+        temp = 0.0
+        response = "ignored"
+        prime_evaluate_cache(
+            criteria, model, temp, response, {"passed": True, "reason": "Looks good"}
+        )
+
+        passed, reason, is_cached = await llm.evaluate(response, criteria, model, temp)
+        assert passed is True
+        assert reason == "Looks good"
+        assert is_cached is True
+
+
+@pytest.mark.usefixtures("mem_llm_cache")
+class TestGenerate:
+    async def test_happy_path(self, monkeypatch):
+        client = make_fake_client(create=returning(fake_resp("GEN-CONTENT-A")))
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        content, cached = await llm.generate("p-A", "m-A", 0.1)
+        assert content == "GEN-CONTENT-A"
+        assert cached is False
+
+    async def test_handles_none_content(self, monkeypatch):
+        client = make_fake_client(create=returning(fake_resp(None)))
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        content, cached = await llm.generate("p-B", "m-B", 0.2)
+        assert content == ""
+        assert cached is False
+
+    @pytest.mark.parametrize("exc_factory, expected", _API_STATUS_CASES)
+    async def test_api_status_error(self, monkeypatch, exc_factory, expected):
+        monkeypatch.setattr(llm.openai, "APIStatusError", _FakeAPIStatusError)
+        client = make_fake_client(create=raiser(exc_factory))
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        with pytest.raises(llm.LLMError, match=expected):
+            await llm.generate("p-C", "m-C", 0.3)
+
+    async def test_api_connection_error(self, monkeypatch):
+        class MyAPIConnectionError(Exception):
+            def __init__(self):
+                self.__cause__ = OSError("network down")
+
+        monkeypatch.setattr(llm.openai, "APIConnectionError", MyAPIConnectionError)
+        client = make_fake_client(create=raiser(MyAPIConnectionError))
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        with pytest.raises(llm.LLMError, match=_RE_CONNECTION):
+            await llm.generate("p-E", "m-E", 0.5)
+
+
+@pytest.mark.usefixtures("mem_llm_cache")
+class TestEvaluate:
+    async def test_happy_path(self, monkeypatch):
+        resp = fake_resp("Some notes\nEVALUATION: PASS - Meets spec")
+        client = make_fake_client(parse=_NO_STRUCTURED, create=returning(resp))
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate(
+            "resp-1", "criteria-1", "judge-1", 0.0
+        )
+        assert passed is True
+        assert reason == "Meets spec"
+        assert cached is False
+
+    async def test_parses_fail(self, monkeypatch):
+        resp = fake_resp("notes\nEVALUATION: FAIL - Not sufficient")
+        client = make_fake_client(parse=_NO_STRUCTURED, create=returning(resp))
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate("r", "c", "m", 0.0)
+        assert passed is False
+        assert reason == "Not sufficient"
+        assert cached is False
+
+    async def test_invalid_format(self, monkeypatch):
+        client = make_fake_client(
+            parse=_NO_STRUCTURED, create=returning(fake_resp("No verdict present"))
+        )
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate(
+            "resp-2", "criteria-2", "judge-2", 0.0
+        )
+        assert passed is False
+        assert reason.startswith("Invalid evaluation format")
+        assert cached is False
+
+    @pytest.mark.parametrize("exc_factory, expected", _API_STATUS_CASES)
+    async def test_api_status_error(self, monkeypatch, exc_factory, expected):
+        monkeypatch.setattr(llm.openai, "APIStatusError", _FakeAPIStatusError)
+        client = make_fake_client(parse=_NO_STRUCTURED, create=raiser(exc_factory))
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        with pytest.raises(llm.LLMError, match=expected):
+            await llm.evaluate("resp-3", "criteria-3", "judge-3", 0.0)
+
+    async def test_handles_none_content(self, monkeypatch):
+        client = make_fake_client(
+            parse=_NO_STRUCTURED, create=returning(fake_resp(None))
+        )
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate(
+            "resp-4", "criteria-4", "judge-4", 0.0
+        )
+        assert passed is False
+        assert reason == "Evaluation failed: LLM returned an empty response."
+        assert cached is False
+
+
+@pytest.mark.usefixtures("mem_llm_cache")
+class TestCallErrorPaths:
+    @pytest.mark.parametrize(
+        "call",
+        [
+            pytest.param(lambda model: llm.generate("p", model, 0.0), id="generate"),
+            pytest.param(
+                lambda model: llm.evaluate("resp", "criteria", model, 0.0),
+                id="evaluate",
+            ),
+        ],
+    )
+    async def test_error_paths(self, monkeypatch, _auth_sentinel, call):
+        async def create(*args, model, **kwargs):
+            raise _ERROR_CASES[model][0](_auth_sentinel)("boom")
+
+        client = make_fake_client(parse=_NO_STRUCTURED, create=create)
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+
+        errors = await asyncio.gather(
+            *(call(model) for model in _ERROR_CASES), return_exceptions=True
+        )
+
+        for (model, (_, expected)), err in zip(_ERROR_CASES.items(), errors):
+            assert isinstance(err, llm.LLMError), model
+            assert expected.search(str(err)), model
+
+
+@pytest.mark.usefixtures("mem_llm_cache")
+class TestStructuredEvaluate:
+    async def test_parse_happy_path(self, monkeypatch):
+        verdict = llm._StructuredVerdict(passed=True, reason="Looks good")
+        client = make_fake_client(parse=returning(fake_resp(parsed=verdict)))
+
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate("resp", "criteria", "judge", 0.0)
+        assert passed is True
+        assert reason == "Looks good"
+        assert cached is False
+
+    async def test_unfaked_parse_fails_loudly(self, monkeypatch):
+        # No silent fallback to text mode when a test forgets to fake parse
+        client = make_fake_client(create=returning(fake_resp("EVALUATION: PASS")))
+
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        with pytest.raises(EndpointNotFaked, match="parse is not faked"):
+            await llm.evaluate("resp", "criteria", "judge", 0.0)
+
+    async def test_json_schema_fallback(self, monkeypatch):
+        client = make_fake_client(
+            parse=raiser(lambda: RuntimeError("parse not available")),
+            create=returning(
+                fake_resp(json.dumps({"passed": False, "reason": "Nope"}))
+            ),
+        )
+
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate("resp", "criteria", "judge", 0.7)
+        assert passed is False
+        assert reason == "Nope"
+        assert cached is False
+
+    async def test_json_object_fallback(self, monkeypatch):
+        async def create(*a, **k):
+            rf = k.get("response_format")
+            if isinstance(rf, dict) and rf.get("type") == "json_schema":
+                raise RuntimeError("json_schema also failed")
+            return fake_resp(json.dumps({"passed": True, "reason": "Recovered"}))
+
+        client = make_fake_client(
+            parse=raiser(lambda: RuntimeError("parse failed")), create=create
+        )
+
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate("resp", "criteria", "judge", 0.0)
+        assert passed is True
+        assert reason == "Recovered"
+        assert cached is False
+
+    async def test_all_structured_attempts_fail_then_text_mode(self, monkeypatch):
+        async def create(*a, **k):
+            rf = k.get("response_format")
+            msgs = k.get("messages") or []
+            if rf is not None:
+                raise RuntimeError("no schema path")
+            if msgs and msgs[0].get("role") == "system":
+                raise RuntimeError("no json_object path")
+            return fake_resp("note\nEVALUATION: PASS - OK")
+
+        client = make_fake_client(
+            parse=raiser(lambda: RuntimeError("no parse")), create=create
+        )
+
+        monkeypatch.setattr(llm, "get_client", lambda: client)
+        passed, reason, cached = await llm.evaluate("resp", "criteria", "judge", 0.2)
+        assert passed is True
+        assert reason == "OK"
+        assert cached is False
+
+    async def test_text_mode_cache_hit(self, monkeypatch):
+        async def fake_try_structured_eval(**kwargs):
+            return None, None, False
+
+        monkeypatch.setattr(llm, "_try_structured_eval", fake_try_structured_eval)
+
+        criteria = "C"
+        response = "R"
+        model = "M"
+        temp = 0.0
+
+        eval_prompt = llm._EVALUATION_PROMPT_TEMPLATE.format(
+            criteria=criteria, response=response
+        )
+        key = llm._get_cache_key(
+            {
+                "v": 2,
+                "mode": "text",
+                "eval_prompt": eval_prompt,
+                "model": model,
+                "temperature": temp,
+            }
+        )
+        monkeypatch.setattr(
+            llm,
+            "_read_cache",
+            lambda k: "notes\nEVALUATION: PASS - From cache" if k == key else None,
+        )
+
+        monkeypatch.setattr(llm, "get_client", lambda: None)
+
+        passed, reason, cached = await llm.evaluate(response, criteria, model, temp)
+        assert passed is True
+        assert reason == "From cache"
+        assert cached is True
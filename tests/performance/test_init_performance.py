@@ -1,36 +1,43 @@
 from __future__ import annotations
 
+import os
 import time
 from pathlib import Path
 
 import pytest
 
-from prompttest.cli import app
+from prompttest.cli import init as _init_impl
+
+# Growing .gitignore sizes with their time budgets for one init pass
+SIZES = [
+    (512, 0.25, "small-<1KB"),
+    (50 * 1024, 0.5, "medium-~50KB"),
+    (2 * 1024 * 1024, 2.0, "large-~2MB"),
+]
 
 
 @pytest.mark.performance
-@pytest.mark.parametrize(
-    "size_bytes, threshold_seconds, label",
-    [
-        (512, 0.25, "small-<1KB"),
-        (50 * 1024, 0.6, "medium-~50KB"),
-        (2 * 1024 * 1024, 2.0, "large-~2MB"),
-    ],
-)
-def test_init_performance_with_preexisting_gitignore(
-    runner, in_tmp_project: Path, size_bytes: int, threshold_seconds: float, label: str
-):
-    gi = in_tmp_project / ".gitignore"
-    gi.write_text("x" * (size_bytes - 1) + "\n", encoding="utf-8")
-
-    t0 = time.perf_counter()
-    res = runner.invoke(app, ["init"])
-    elapsed = time.perf_counter() - t0
-
-    assert res.exit_code == 0, f"init failed for case {label}"
-    assert elapsed < threshold_seconds, f"init too slow for {label}: {elapsed:.3f}s"
-
-    content = gi.read_text(encoding="utf-8")
-    assert "# prompttest cache\n.prompttest_cache/" in content
-    assert "# Test reports\n.prompttest_reports/" in content
-    assert "# Environment variables\n.env" in content
+def test_init_performance_with_preexisting_gitignore(pre_initialized_project: Path):
+    # Scaffold already in place: init only skips files and appends to .gitignore
+    gi = pre_initialized_project / ".gitignore"
+    for size_bytes, threshold_seconds, label in SIZES:
+        # Size is all that matters: zero-fill via ftruncate, then end with a
+        # newline ("wb" drops the blocks the previous pass appended)
+        with open(gi, "wb") as f:
+            os.ftruncate(f.fileno(), size_bytes - 1)
+            f.seek(size_bytes - 1)
+            f.write(b"\n")
+        assert gi.stat().st_size == size_bytes
+
+        # Call the command body directly so Click dispatch stays out of the
+        # timed window; a failing init raises typer.Exit instead of returning
+        t0 = time.perf_counter()
+        _init_impl()
+        elapsed = time.perf_counter() - t0
+
+        assert elapsed < threshold_seconds, f"init too slow for {label}: {elapsed:.3f}s"
+
+        content = gi.read_bytes().decode("utf-8")
+        assert "# prompttest cache\n.prompttest_cache/" in content
+        assert "# Test reports\n.prompttest_reports/" in content
+        assert "# Environment variables\n.env" in content
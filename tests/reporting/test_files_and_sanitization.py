@@ -1,49 +1,57 @@
 from __future__ import annotations
 
+import io
 import os
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from rich.console import Console
 
 from prompttest import reporting
-from prompttest.reporting import (
-    REPORTS_DIR,
-    create_latest_symlink,
-    create_run_directory,
-)
+from prompttest.reporting import REPORTS_DIR, create_latest_symlink
 
+_CONSOLE = Console(force_terminal=False, no_color=True, width=80, file=io.StringIO())
 
-@pytest.mark.parametrize(
-    "src, expected",
-    [
-        ("abc/def:ghi\\jkl?.txt  ", "abc_def_ghi_jkl_.txt"),
-        ("  ...name...  ", "name"),
-        ('<>:":/\\|?*\\r\\n\\t', "r_n_t"),
-        ('<>:":/\\|?*\r\n\t', "item"),
-        ("", "item"),
-        ("a__b///c.. ", "a_b_c"),
-    ],
-    ids=[
-        "mixed-seps-and-illegal",
-        "trim-dots",
-        "all-illegal-literal",
-        "all-illegal-control-chars",
-        "empty",
-        "collapse-underscores",
-    ],
-)
-def test_sanitize_for_filename_edge_cases(src: str, expected: str, monkeypatch):
-    monkeypatch.setattr(reporting.os, "altsep", "/", raising=False)
-    out = reporting._sanitize_for_filename(src)
-    assert out == expected
+
+class TestSanitizeForFilename:
+    @pytest.fixture(scope="class", autouse=True)
+    def _fix_altsep(self) -> Iterator[None]:
+        # Patched once for the whole class; reporting.os is the global os module,
+        # so the context restores the real altsep before the rest of the module
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(reporting.os, "altsep", "/", raising=False)
+            yield
+
+    @pytest.mark.parametrize(
+        "src, expected",
+        [
+            ("abc/def:ghi\\jkl?.txt  ", "abc_def_ghi_jkl_.txt"),
+            ("  ...name...  ", "name"),
+            ('<>:":/\\|?*\\r\\n\\t', "r_n_t"),
+            ('<>:":/\\|?*\r\n\t', "item"),
+            ("", "item"),
+            ("a__b///c.. ", "a_b_c"),
+        ],
+        ids=[
+            "mixed-seps-and-illegal",
+            "trim-dots",
+            "all-illegal-literal",
+            "all-illegal-control-chars",
+            "empty",
+            "collapse-underscores",
+        ],
+    )
+    def test_edge_cases(self, src: str, expected: str):
+        out = reporting._sanitize_for_filename(src)
+        assert out == expected
 
 
 def test_create_latest_symlink_existing_symlink_unlink_failure(
-    monkeypatch, in_tmp_project: Path, capsys
+    monkeypatch, fresh_run_dir: Path
 ):
-    run_dir = create_run_directory()
-    create_latest_symlink(run_dir, Console())
+    run_dir = fresh_run_dir
+    create_latest_symlink(run_dir, _CONSOLE)
     latest = REPORTS_DIR / "latest"
     assert latest.exists() and latest.is_symlink()
 
@@ -55,8 +63,9 @@ def test_create_latest_symlink_existing_symlink_unlink_failure(
         return orig_unlink(self)
 
     monkeypatch.setattr(Path, "unlink", bad_unlink)
-    create_latest_symlink(run_dir, Console())
-    out = capsys.readouterr().out
+    buf = io.StringIO()
+    create_latest_symlink(run_dir, Console(file=buf, no_color=True, width=200))
+    out = buf.getvalue()
     assert "Warning:" in out
     assert "Could not remove existing symlink 'latest'." in out
 
@@ -1,31 +1,30 @@
 from __future__ import annotations
 
+import io
 import os
 from pathlib import Path
 
 from rich.console import Console
 
-from prompttest.reporting import (
-    REPORTS_DIR,
-    create_latest_symlink,
-    create_run_directory,
-)
+from prompttest.reporting import REPORTS_DIR, create_latest_symlink
+
+_CONSOLE = Console(force_terminal=False, no_color=True, width=80, file=io.StringIO())
 
 
 def test_create_latest_symlink_copytree_fallback_copies_contents(
-    monkeypatch, in_tmp_project: Path
+    monkeypatch, fresh_run_dir: Path
 ):
-    run_dir = create_run_directory()
-    (run_dir / "proof.txt").write_text("hello", encoding="utf-8")
+    run_dir = fresh_run_dir
+    (run_dir / "proof.txt").write_bytes(b"hello")
 
     def always_fail_symlink(*a, **k):
         raise OSError("no symlink")
 
     monkeypatch.setattr(os, "symlink", always_fail_symlink)
 
-    create_latest_symlink(run_dir, Console())
+    create_latest_symlink(run_dir, _CONSOLE)
 
     latest = REPORTS_DIR / "latest"
     assert latest.exists()
     assert latest.is_dir()
-    assert (latest / "proof.txt").read_text(encoding="utf-8") == "hello"
+    assert (latest / "proof.txt").read_bytes() == b"hello"
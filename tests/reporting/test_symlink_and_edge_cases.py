@@ -1,92 +1,112 @@
 from __future__ import annotations
 
+import io
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Optional
 
+import pytest
 from rich.console import Console
 
-from prompttest import reporting
 from prompttest.reporting import (
     REPORTS_DIR,
     create_latest_symlink,
     create_run_directory,
 )
 
+_CONSOLE = Console(force_terminal=False, no_color=True, width=80, file=io.StringIO())
 
-def test_create_run_directory_collision_same_timestamp(
-    monkeypatch, in_tmp_project: Path
-):
-    class FixedDatetime:
-        @staticmethod
-        def now():
-            return datetime(2025, 1, 1, 0, 0, 0, 0)
 
-    monkeypatch.setattr(reporting, "datetime", FixedDatetime)
+def test_create_run_directory_collision_same_timestamp(in_tmp_project: Path):
+    def fixed_now():
+        return datetime(2025, 1, 1, 0, 0, 0, 0)
 
-    run1 = create_run_directory()
+    run1 = create_run_directory(now_fn=fixed_now)
     assert run1.exists()
-    run2 = create_run_directory()
+    run2 = create_run_directory(now_fn=fixed_now)
     assert run2.exists()
     assert run2.name.startswith(run1.name)
     assert run2.name != run1.name
     assert any(part.endswith("-1") for part in [run2.name])
-    create_latest_symlink(run2, Console())
+    create_latest_symlink(run2, _CONSOLE)
     assert (REPORTS_DIR / "latest").exists()
 
 
-def test_create_latest_symlink_replaces_empty_dir(in_tmp_project: Path):
-    run_dir = create_run_directory()
-    latest = REPORTS_DIR / "latest"
-    latest.mkdir(parents=True, exist_ok=True)
-    assert latest.is_dir() and not latest.is_symlink()
+def test_create_run_directory_sequential_runs_repoint_latest(in_tmp_project: Path):
+    # Two ticks of a fake clock instead of sleeping for a distinct timestamp
+    ticks = iter([datetime(2025, 1, 1, 0, 0, 0), datetime(2025, 1, 1, 0, 0, 1)])
 
-    create_latest_symlink(run_dir, Console())
+    run1 = create_run_directory(now_fn=ticks.__next__)
+    create_latest_symlink(run1, _CONSOLE)
+    run2 = create_run_directory(now_fn=ticks.__next__)
+    create_latest_symlink(run2, _CONSOLE)
 
-    assert latest.exists()
-    assert latest.is_symlink()
+    assert (run1.name, run2.name) == (
+        "2025-01-01_00-00-00-000000",
+        "2025-01-01_00-00-01-000000",
+    )
+    assert (REPORTS_DIR / "latest").resolve() == run2.resolve()
 
 
-def test_create_latest_symlink_warns_on_nonempty_dir(in_tmp_project: Path, capsys):
-    run_dir = create_run_directory()
-    latest = REPORTS_DIR / "latest"
-    latest.mkdir(parents=True, exist_ok=True)
-    (latest / "keep.txt").write_text("x", encoding="utf-8")
+def _no_latest(latest: Path) -> None:
+    pass
 
-    create_latest_symlink(run_dir, Console())
-    out = capsys.readouterr().out
 
-    assert "Warning:" in out
-    assert "Cannot replace existing 'latest'" in out
-    assert latest.exists() and latest.is_dir()
+def _empty_dir(latest: Path) -> None:
+    latest.mkdir()
 
 
-def test_create_latest_symlink_replaces_file(in_tmp_project: Path):
-    run_dir = create_run_directory()
-    latest = REPORTS_DIR / "latest"
-    latest.write_text("x", encoding="utf-8")
+def _file(latest: Path) -> None:
+    latest.write_bytes(b"x")
 
-    create_latest_symlink(run_dir, Console())
 
-    assert latest.exists()
-    assert latest.is_symlink()
+def _previous_run_symlink(latest: Path) -> None:
+    previous = REPORTS_DIR / "previous-run"
+    previous.mkdir()
+    os.symlink(previous.name, latest, target_is_directory=True)
 
 
-def test_create_run_directory_and_latest_symlink(in_tmp_project: Path):
-    run1 = create_run_directory()
-    assert run1.exists() and run1.is_dir()
-    create_latest_symlink(run1, Console())
-    latest = REPORTS_DIR / "latest"
-    assert latest.exists()
+def _nonempty_dir(latest: Path) -> None:
+    latest.mkdir()
+    (latest / "keep.txt").write_bytes(b"x")
 
-    # Ensure a different timestamp on the next run directory
-    run2 = create_run_directory()
-    create_latest_symlink(run2, Console())
-    assert latest.exists()
 
+@pytest.mark.parametrize(
+    "setup, warning",
+    [
+        pytest.param(_no_latest, None, id="no-latest"),
+        pytest.param(_empty_dir, None, id="empty-dir"),
+        pytest.param(_file, None, id="file"),
+        pytest.param(_previous_run_symlink, None, id="previous-run-symlink"),
+        pytest.param(
+            _nonempty_dir, "Cannot replace existing 'latest'", id="nonempty-dir-warns"
+        ),
+    ],
+)
+def test_create_latest_symlink_pre_states(
+    fresh_run_dir: Path, setup: Callable[[Path], None], warning: Optional[str]
+):
+    latest = REPORTS_DIR / "latest"
+    setup(latest)
+
+    buf = io.StringIO()
+    create_latest_symlink(fresh_run_dir, Console(file=buf, no_color=True, width=200))
+    out = buf.getvalue()
 
-def test_create_latest_symlink_fallback(monkeypatch, in_tmp_project: Path, capsys):
-    run_dir = create_run_directory()
+    assert latest.exists()
+    if warning is None:
+        assert latest.is_symlink()
+        assert latest.resolve() == fresh_run_dir.resolve()
+        assert out == ""
+    else:
+        assert "Warning:" in out
+        assert warning in out
+        assert latest.is_dir() and not latest.is_symlink()
+
+
+def test_create_latest_symlink_fallback(monkeypatch, fresh_run_dir: Path):
+    run_dir = fresh_run_dir
     calls = {"n": 0}
 
     def fake_symlink(src, dst, target_is_directory=True):
@@ -98,6 +118,7 @@ def test_create_latest_symlink_fallback(monkeypatch, in_tmp_project: Path, capsy
         raise OSError("nope")
 
     monkeypatch.setattr(os, "symlink", fake_symlink)
-    create_latest_symlink(run_dir, Console())
-    out = capsys.readouterr().out
+    buf = io.StringIO()
+    create_latest_symlink(run_dir, Console(file=buf, no_color=True, width=200))
+    out = buf.getvalue()
     assert "Warning:" in out
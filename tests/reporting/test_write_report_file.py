@@ -8,17 +8,14 @@ from prompttest.models import (
     TestCase as PTTestCase,
     TestResult as PTTestResult,
 )
-from prompttest.reporting import (
-    create_run_directory,
-    write_report_file,
-)
+from prompttest.reporting import write_report_file
 
 
-def test_write_single_report_file(in_tmp_project: Path):
+def test_write_single_report_file(fresh_run_dir: Path):
     (PROMPTS_DIR).mkdir(exist_ok=True)
     prompt_name = "customer_service"
     prompt_path = PROMPTS_DIR / f"{prompt_name}.txt"
-    prompt_path.write_text("Prompt body here", encoding="utf-8")
+    prompt_path.write_bytes(b"Prompt body here")
 
     tr = PTTestResult(
         test_case=PTTestCase(id="t-1", inputs={}, criteria="crit"),
@@ -35,10 +32,10 @@ def test_write_single_report_file(in_tmp_project: Path):
         response="Resp",
         evaluation="OK",
     )
-    run_dir = create_run_directory()
+    run_dir = fresh_run_dir
     write_report_file(tr, run_dir)
     report_path = run_dir / "suite-t-1.md"
-    content = report_path.read_text(encoding="utf-8")
+    content = report_path.read_bytes().decode("utf-8")
     assert "# ✅ Test Pass Report: `t-1`" in content
     assert "- **Generation Model**: `g-model`" in content
     assert "## Request (Prompt + Values)" in content
@@ -1,34 +1,35 @@
 from __future__ import annotations
 
-from pathlib import Path
+import contextlib
+import io
 
 import pytest
 
 from prompttest import runner
 
+pytestmark = pytest.mark.usefixtures("_no_leaked_tasks")
 
-@pytest.mark.asyncio
-async def test_runner_no_tests_found(in_tmp_project: Path, capsys):
-    pdir = in_tmp_project / "prompttests"
-    pdir.mkdir()
-    (pdir / "prompttest.yml").write_text("config: {}", encoding="utf-8")
 
-    code = await runner.run_all_tests()
-    out = capsys.readouterr().out
+async def test_runner_no_tests_found(write_suite_file):
+    write_suite_file("prompttest.yml", b"config: {}")
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        code = await runner.run_all_tests()
+    out = buf.getvalue()
     assert code == 0
     assert "No tests found." in out
 
 
-@pytest.mark.asyncio
-async def test_runner_discovery_value_error(in_tmp_project: Path, capsys):
-    pdir = in_tmp_project / "prompttests"
-    pdir.mkdir()
-    (pdir / "bad.yml").write_text(
-        "config:\n  prompt: customer_service\ntests:\n  - id: a\n    inputs\n      x: y\n",
-        encoding="utf-8",
+async def test_runner_discovery_value_error(write_suite_file):
+    write_suite_file(
+        "bad.yml",
+        b"config:\n  prompt: customer_service\ntests:\n  - id: a\n    inputs\n      x: y\n",
     )
 
-    code = await runner.run_all_tests()
-    out = capsys.readouterr().out
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        code = await runner.run_all_tests()
+    out = buf.getvalue()
     assert code == 1
     assert "Error:" in out
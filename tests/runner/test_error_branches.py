@@ -1,33 +1,30 @@
 from __future__ import annotations
 
+import contextlib
+import io
+import re
 from pathlib import Path
 
 import pytest
 
-
 from prompttest import llm, runner
 
+pytestmark = pytest.mark.usefixtures("_no_leaked_tasks")
+
+_ERROR = re.compile(r"API Error|Error:")
+_SUITE = (
+    b"config:\n  prompt: customer_service\n"
+    b"tests:\n  - id: t1\n    inputs: {}\n    criteria: 'x'\n"
+)
 
-def _write_suite(tmp: Path, name="suite.yml") -> Path:
-    d = tmp / "prompttests"
-    d.mkdir(parents=True, exist_ok=True)
-    p = d / name
-    p.write_text(
-        "config:\n  prompt: customer_service\n"
-        "tests:\n"
-        "  - id: t1\n    inputs: {}\n    criteria: 'x'\n",
-        encoding="utf-8",
-    )
-    pd = tmp / "prompts"
-    pd.mkdir(exist_ok=True)
-    (pd / "customer_service.txt").write_text("Hello {name}", encoding="utf-8")
-    return p
 
+@pytest.fixture()
+def _suite(stub_llm, write_suite_file, write_prompt_file) -> Path:
+    write_prompt_file("customer_service", "Hello {name}")
+    return write_suite_file("suite.yml", _SUITE)
 
-@pytest.mark.asyncio
-async def test_runner_generate_llmerror(monkeypatch, in_tmp_project: Path, capsys):
-    _write_suite(in_tmp_project)
 
+async def test_runner_generate_llmerror(monkeypatch, _suite):
     class E(llm.LLMError):
         pass
 
@@ -36,26 +33,15 @@ async def test_runner_generate_llmerror(monkeypatch, in_tmp_project: Path, capsy
 
     monkeypatch.setattr(llm, "generate", bad_generate)
 
-    async def ok_eval(*a, **k):
-        return True, "ok", False
-
-    monkeypatch.setattr(llm, "evaluate", ok_eval)
-
-    code = await runner.run_all_tests()
-    out = capsys.readouterr().out
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        code = await runner.run_all_tests()
+    out = buf.getvalue()
     assert code == 1
-    assert "API Error" in out or "Error:" in out
-
-
-@pytest.mark.asyncio
-async def test_runner_evaluate_llmerror(monkeypatch, in_tmp_project: Path, capsys):
-    _write_suite(in_tmp_project)
-
-    async def ok_generate(*a, **k):
-        return "resp", False
+    assert _ERROR.search(out)
 
-    monkeypatch.setattr(llm, "generate", ok_generate)
 
+async def test_runner_evaluate_llmerror(monkeypatch, _suite):
     class E(llm.LLMError):
         pass
 
@@ -64,7 +50,9 @@ async def test_runner_evaluate_llmerror(monkeypatch, in_tmp_project: Path, capsy
 
     monkeypatch.setattr(llm, "evaluate", bad_evaluate)
 
-    code = await runner.run_all_tests()
-    out = capsys.readouterr().out
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        code = await runner.run_all_tests()
+    out = buf.getvalue()
     assert code == 1
-    assert "API Error" in out or "Error:" in out
+    assert _ERROR.search(out)
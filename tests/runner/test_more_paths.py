@@ -1,22 +1,45 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
-from prompttest import runner
+from prompttest import llm, runner
+
+pytestmark = pytest.mark.usefixtures("_no_leaked_tasks")
+
+_CONFIG = b"config:\n  prompt: cs\n  generation_model: g\n  evaluation_model: e\n"
+_SUITE_BAD = (
+    b"config:\n  prompt: missing\n"
+    b"tests:\n  - id: t\n    inputs: {}\n    criteria: 'x'\n"
+)
+_SUITE_ONE = _CONFIG + b"tests:\n  - id: alpha\n    inputs: {}\n    criteria: 'ok'\n"
+_SUITE_MULTI = (
+    _CONFIG + b"tests:\n"
+    b"  - id: t1\n    inputs: {}\n    criteria: 'ok'\n"
+    b"  - id: t2\n    inputs: {}\n    criteria: 'ok'\n"
+)
+_SUITE_WIDE = (
+    _CONFIG
+    + b"tests:\n"
+    + b"".join(
+        b"  - id: t%d\n    inputs: {}\n    criteria: 'ok'\n" % i for i in range(12)
+    )
+)
+
+
+@pytest.fixture()
+def cs_project(write_prompt_file, write_suite_file):
+    # The cs prompt the suites render; each test writes the suite it needs
+    write_prompt_file("cs", "Hello {x}")
+    return write_suite_file
 
 
-@pytest.mark.asyncio
 async def test_runner_file_not_found_for_missing_prompt_not_init_branch(
-    in_tmp_project: Path, capsys
+    capsys, cs_project
 ):
-    Path("prompttests").mkdir()
-    Path("prompttests/bad.yml").write_text(
-        "config:\n  prompt: missing\n"
-        "tests:\n  - id: t\n    inputs: {}\n    criteria: 'x'\n",
-        encoding="utf-8",
-    )
+    cs_project("bad.yml", _SUITE_BAD)
     code = await runner.run_all_tests()
     out = capsys.readouterr().out
     assert code == 1
@@ -24,28 +47,10 @@ async def test_runner_file_not_found_for_missing_prompt_not_init_branch(
     assert "Prompt file not found: prompts/missing.txt" in out
 
 
-@pytest.mark.asyncio
 async def test_runner_test_id_globs_no_match_prints_no_tests_found(
-    monkeypatch, in_tmp_project: Path, capsys, write_prompt_file
+    stub_llm, capsys, cs_project
 ):
-    write_prompt_file("cs", "Hello {x}")
-    Path("prompttests").mkdir()
-    Path("prompttests/one.yml").write_text(
-        "config:\n  prompt: cs\n  generation_model: g\n  evaluation_model: e\n"
-        "tests:\n  - id: alpha\n    inputs: {}\n    criteria: 'ok'\n",
-        encoding="utf-8",
-    )
-
-    async def ok_gen(*a, **k):
-        return "resp", False
-
-    async def ok_eval(*a, **k):
-        return True, "ok", False
-
-    from prompttest import llm as llm_mod
-
-    monkeypatch.setattr(llm_mod, "generate", ok_gen)
-    monkeypatch.setattr(llm_mod, "evaluate", ok_eval)
+    cs_project("one.yml", _SUITE_ONE)
 
     code = await runner.run_all_tests(test_id_globs=["does-not-match-*"])
     out = capsys.readouterr().out
@@ -53,30 +58,41 @@ async def test_runner_test_id_globs_no_match_prints_no_tests_found(
     assert "No tests found." in out
 
 
-@pytest.mark.asyncio
-async def test_runner_unlimited_concurrency_path(
-    monkeypatch, in_tmp_project: Path, write_prompt_file
-):
-    write_prompt_file("cs", "Hello {x}")
-    Path("prompttests").mkdir()
-    Path("prompttests/multi.yml").write_text(
-        "config:\n  prompt: cs\n  generation_model: g\n  evaluation_model: e\n"
-        "tests:\n"
-        "  - id: t1\n    inputs: {}\n    criteria: 'ok'\n"
-        "  - id: t2\n    inputs: {}\n    criteria: 'ok'\n",
-        encoding="utf-8",
-    )
+@pytest.fixture()
+def multi_suite(stub_llm, cs_project) -> Path:
+    return cs_project("multi.yml", _SUITE_MULTI)
 
-    async def ok_gen(*a, **k):
-        return "resp", False
 
-    async def ok_eval(*a, **k):
-        return True, "ok", False
+# 0 = unlimited, 1 = fully serialized, 4 = bounded but wider than the suite
+@pytest.mark.parametrize("mc", [0, 1, 4])
+async def test_runner_concurrency_paths(multi_suite, mc: int):
+    code = await runner.run_all_tests(max_concurrency=mc)
+    assert code == 0
 
-    from prompttest import llm as llm_mod
 
-    monkeypatch.setattr(llm_mod, "generate", ok_gen)
-    monkeypatch.setattr(llm_mod, "evaluate", ok_eval)
+@pytest.mark.parametrize(
+    "mc, peak",
+    [
+        pytest.param(None, runner.DEFAULT_MAX_CONCURRENCY, id="default-cap"),
+        pytest.param(4, 4, id="explicit-cap"),
+        pytest.param(0, 12, id="unlimited"),
+    ],
+)
+async def test_runner_peak_generate_concurrency(
+    monkeypatch, stub_llm, cs_project, mc, peak: int
+):
+    cs_project("wide.yml", _SUITE_WIDE)
+    live = seen = 0
+
+    async def counting_gen(*args, **kwargs):
+        nonlocal live, seen
+        live += 1
+        seen = max(seen, live)
+        await asyncio.sleep(0)
+        live -= 1
+        return "resp", False
 
-    code = await runner.run_all_tests(max_concurrency=0)
-    assert code == 0
+    monkeypatch.setattr(llm, "generate", counting_gen)
+
+    assert await runner.run_all_tests(max_concurrency=mc) == 0
+    assert seen == peak
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import io
 import re
 from pathlib import Path
+from typing import Iterator, Tuple
 
 import pytest
+from _asserts import assert_all_in
 from rich.console import Console
 
 from prompttest import ui
@@ -14,6 +17,9 @@ from prompttest.models import (
 )
 from prompttest.ui import _truncate_text, render_template_error
 
+_PASS_RATE_100 = re.compile(r"\b100% pass rate\b")
+_PASS_RATE_25 = re.compile(r"\b25% pass rate\b")
+
 
 @pytest.mark.parametrize(
     "src, max_lines, expected",
@@ -21,6 +27,7 @@ from prompttest.ui import _truncate_text, render_template_error
         ("a\nb\nc\nd", 3, "a\nb\nc\n[...]"),
         ("a\nb\nc", 5, "a\nb\nc"),
         ("   \na\n", 1, "a"),
+        ("x\n" * 10000, 3, "x\nx\nx\n[...]"),
     ],
 )
 def test_truncate_text_variants(src: str, max_lines: int, expected: str):
@@ -66,70 +73,111 @@ def _mk_result(
     )
 
 
-def test_render_summary_all_pass_includes_pass_rate_and_cached(capsys):
-    console = Console()
-    results = [
-        _mk_result(
-            suite_path="prompttests/a.yml", test_id="t1", passed=True, is_cached=True
-        ),
-        _mk_result(
-            suite_path="prompttests/a.yml", test_id="t2", passed=True, is_cached=True
-        ),
-        _mk_result(
-            suite_path="prompttests/b.yml", test_id="t3", passed=True, is_cached=False
-        ),
-    ]
-    ui.render_summary(console, results, elapsed_time=0.42)
-    out = capsys.readouterr().out
-    assert "passed" in out
-    assert re.search(r"\b100% pass rate\b", out) is not None
-    assert re.search(r"\b2 cached\b", out) is not None
-    assert "prompttests/a.yml" not in out
-    assert "prompttests/b.yml" not in out
-
-
-def test_render_summary_lists_failures_with_suite_id_and_truncated_reason(capsys):
-    console = Console()
-    results = [
-        _mk_result(
-            suite_path="prompttests/a.yml",
-            test_id="t1",
-            passed=False,
-            evaluation="First line of reason\nSecond line of reason",
-        ),
-        _mk_result(
-            suite_path="prompttests/a.yml",
-            test_id="t2",
-            passed=False,
-            evaluation="Only one line reason",
-        ),
-        _mk_result(
-            suite_path="prompttests/b.yml",
-            test_id="t3",
-            passed=False,
-            error="API returned a 503 status code from provider 'foo'.",
-        ),
-        _mk_result(suite_path="prompttests/c.yml", test_id="p1", passed=True),
-    ]
-    ui.render_summary(console, results, elapsed_time=1.23)
-    out = capsys.readouterr().out
-
-    assert "passed" in out and "failed" in out
-    assert re.search(r"\b25% pass rate\b", out) is not None
-
-    assert "prompttests/a.yml" in out
-    assert "prompttests/b.yml" in out
-    assert "t1" in out and "t2" in out and "t3" in out
+def _null_console(buf: io.StringIO) -> Console:
+    # Every capability pinned, so Rich probes neither the terminal nor its size
+    return Console(
+        file=buf,
+        force_terminal=False,
+        color_system=None,
+        width=100,
+        no_color=True,
+        highlight=False,
+    )
 
-    assert "First line of reason" in out
-    assert "[...]" in out
-    assert "Only one line reason" in out
 
-    assert "API returned a 503 status code from provider 'foo'." in out
+@pytest.fixture(scope="module")
+def rich_console() -> Iterator[Tuple[Console, io.StringIO]]:
+    # One plain console for the module; each test rewinds the buffer first
+    buf = io.StringIO()
+    yield _null_console(buf), buf
+
+
+@pytest.fixture()
+def summary_console(rich_console: Tuple[Console, io.StringIO]):
+    console, buf = rich_console
+    buf.seek(0)
+    buf.truncate()
+    return console, buf
+
+
+# Built once at import; render_summary only reads its results
+_ALL_PASS_RESULTS = (
+    _mk_result(
+        suite_path="prompttests/a.yml", test_id="t1", passed=True, is_cached=True
+    ),
+    _mk_result(
+        suite_path="prompttests/a.yml", test_id="t2", passed=True, is_cached=True
+    ),
+    _mk_result(
+        suite_path="prompttests/b.yml", test_id="t3", passed=True, is_cached=False
+    ),
+)
+_FAIL_MIX_RESULTS = (
+    _mk_result(
+        suite_path="prompttests/a.yml",
+        test_id="t1",
+        passed=False,
+        evaluation="First line of reason\nSecond line of reason",
+    ),
+    _mk_result(
+        suite_path="prompttests/a.yml",
+        test_id="t2",
+        passed=False,
+        evaluation="Only one line reason",
+    ),
+    _mk_result(
+        suite_path="prompttests/b.yml",
+        test_id="t3",
+        passed=False,
+        error="API returned a 503 status code from provider 'foo'.",
+    ),
+    _mk_result(suite_path="prompttests/c.yml", test_id="p1", passed=True),
+)
 
 
-def test_render_summary_with_no_tests_prints_nothing(capsys):
-    console = Console()
-    ui.render_summary(console, [], elapsed_time=0.01)
-    out = capsys.readouterr().out
-    assert out == ""
+@pytest.mark.parametrize(
+    "results, elapsed, rate_re, present, absent",
+    [
+        pytest.param(
+            _ALL_PASS_RESULTS,
+            0.42,
+            _PASS_RATE_100,
+            ("passed", "2 cached"),
+            ("prompttests/a.yml", "prompttests/b.yml"),
+            id="all-pass-includes-pass-rate-and-cached",
+        ),
+        pytest.param(
+            _FAIL_MIX_RESULTS,
+            1.23,
+            _PASS_RATE_25,
+            (
+                "passed",
+                "failed",
+                "prompttests/a.yml",
+                "prompttests/b.yml",
+                "t1",
+                "t2",
+                "t3",
+                "First line of reason",
+                "[...]",
+                "Only one line reason",
+                "API returned a 503 status code from provider 'foo'.",
+            ),
+            (),
+            id="lists-failures-with-suite-id-and-truncated-reason",
+        ),
+        pytest.param((), 0.01, None, (), (), id="no-tests-prints-nothing"),
+    ],
+)
+def test_render_summary(summary_console, results, elapsed, rate_re, present, absent):
+    console, buf = summary_console
+    ui.render_summary(console, results, elapsed_time=elapsed)
+    out = buf.getvalue()
+
+    if not results:
+        assert out == ""
+        return
+    assert rate_re.search(out) is not None
+    assert_all_in(out, *present)
+    for text in absent:
+        assert text not in out